@@ -3,20 +3,37 @@
 This app estimates cooling load for a given building type and square footage.
 """
 
-import base64
 import json
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any, List, Optional
 
 import boto3
+import numpy as np
 import pandas as pd  # type: ignore
-import plotly.express as px  # Add for visualization # type: ignore
 import streamlit as st
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
-from fpdf import FPDF  # type: ignore
-from pydantic import BaseModel, Field, ValidationError, model_validator, validate_call
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+try:
+    # Rust-backed JSON parsing for the legacy string-format project blobs;
+    # falls back to stdlib json if orjson isn't installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 try:
     from dotenv import load_dotenv
@@ -35,6 +52,8 @@ except ImportError:
         print("ℹ️  python-dotenv not installed, using system environment variables")
         st.session_state['env_loaded'] = True
 
+log = logging.getLogger(__name__)
+
 # AWS Cognito configuration - these will come from CDK outputs
 COGNITO_USER_POOL_ID = os.environ.get('COGNITO_USER_POOL_ID')
 COGNITO_CLIENT_ID = os.environ.get('COGNITO_CLIENT_ID')
@@ -62,15 +81,37 @@ if not COGNITO_USER_POOL_ID or not COGNITO_CLIENT_ID:
     """)
     st.stop()
 
-# Initialize AWS clients
-cognito_client = boto3.client('cognito-idp', region_name='us-east-1')
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+# Initialize AWS clients once per worker process; building a boto3 session
+# walks the credential provider chain (env/SSO/IMDS), which is too slow to
+# repeat on every Streamlit rerun. Caching also reuses botocore's HTTP
+# connection pool across reruns.
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """Shared worker pool so DynamoDB round trips can run off the script thread"""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_resource
+def _aws() -> SimpleNamespace:
+    """Shared boto3 session, clients, and DynamoDB table resource"""
+    session = boto3.Session(region_name='us-east-1')
+    dynamodb = session.resource('dynamodb')
+    ns = SimpleNamespace(
+        cognito=session.client('cognito-idp'),
+        dynamodb=dynamodb,
+        table=dynamodb.Table(DYNAMODB_TABLE_NAME),
+    )
+    # Pre-warm the HTTPS connection off-thread so the first real request
+    # doesn't pay the TLS handshake. Goes through the client (thread-safe)
+    # rather than the Table resource (not thread-safe).
+    client = ns.table.meta.client
+    _executor().submit(client.describe_table, TableName=DYNAMODB_TABLE_NAME)
+    return ns
 
 # Authentication functions
 def sign_up(username, password, email):
     try:
-        response = cognito_client.sign_up(
+        response = _aws().cognito.sign_up(
             ClientId=COGNITO_CLIENT_ID,
             Username=username,
             Password=password,
@@ -82,7 +123,7 @@ def sign_up(username, password, email):
 
 def confirm_sign_up(username, code):
     try:
-        response = cognito_client.confirm_sign_up(
+        response = _aws().cognito.confirm_sign_up(
             ClientId=COGNITO_CLIENT_ID,
             Username=username,
             ConfirmationCode=code
@@ -93,7 +134,7 @@ def confirm_sign_up(username, code):
 
 def sign_in(username, password):
     try:
-        response = cognito_client.initiate_auth(
+        response = _aws().cognito.initiate_auth(
             ClientId=COGNITO_CLIENT_ID,
             AuthFlow='USER_PASSWORD_AUTH',
             AuthParameters={
@@ -107,58 +148,80 @@ def sign_in(username, password):
     except ClientError as e:
         return False, str(e)
 
+# Project configs are stored as native DynamoDB maps (not JSON strings), so
+# loads skip a JSON parse and ProjectionExpressions can fetch partial
+# documents. DynamoDB's Table API speaks Decimal, not float, hence the
+# converters below.
+def _to_ddb(obj: Any) -> Any:
+    """Convert floats to Decimal for DynamoDB storage"""
+    if isinstance(obj, float):
+        return Decimal(str(obj))
+    if isinstance(obj, dict):
+        return {k: _to_ddb(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_to_ddb(v) for v in obj]
+    return obj
+
+def _from_ddb(obj: Any) -> Any:
+    """Convert Decimals back to int/float for Pydantic"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, dict):
+        return {k: _from_ddb(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_from_ddb(v) for v in obj]
+    return obj
+
+def _parse_config(raw):
+    """Accept both the native-map format and the legacy JSON string"""
+    if isinstance(raw, str):
+        return _json_loads(raw)
+    return _from_ddb(raw)
+
 def save_project(project_name, range_results, selected_building_types, current_building_type, square_footage):
-    if 'access_token' not in st.session_state:
+    if not st.session_state.get('access_token'):
         return False, "Please log in to save projects"
 
     try:
-        # Check if this is an update to an existing project
-        is_update = False
-        created_at = datetime.now().isoformat()
-        
-        # Try to get existing project to preserve creation date
-        try:
-            response = table.get_item(
-                Key={
-                    'username': st.session_state['username'],
-                    'project_name': project_name
-                }
-            )
-            if 'Item' in response:
-                existing_config = json.loads(response['Item']['config'])
-                created_at = existing_config.get('created_at', created_at)
-                is_update = True
-        except:
-            pass  # If we can't get existing project, treat as new
-        
         now = datetime.now().isoformat()
-        
+
         # Ensure we have a valid current_building_type
         if not current_building_type and selected_building_types:
             current_building_type = selected_building_types[0]  # Default to first selected
         elif not current_building_type:
             return False, "No building type selected"
-        
+
         project_config = ProjectConfig(
             project_name=project_name,
             selected_building_types=selected_building_types,
             current_building_type=current_building_type,
             square_footage=square_footage,
             range_results=range_results,
-            created_at=created_at,
+            created_at=now,
             updated_at=now
         )
-        
-        table.put_item(
-            Item={
+
+        # Single conditional write: if_not_exists preserves the original
+        # created_at on updates, so no existence-check get_item round trip
+        # is needed. UPDATED_OLD tells us whether this was an update.
+        response = _aws().table.update_item(
+            Key={
                 'username': st.session_state['username'],
-                'project_name': project_name,
-                'config': json.dumps(project_config.model_dump()),
-                'created_at': created_at,
-                'updated_at': now
-            }
+                'project_name': project_name
+            },
+            UpdateExpression=(
+                'SET #config = :config, updated_at = :now, '
+                'created_at = if_not_exists(created_at, :now)'
+            ),
+            ExpressionAttributeNames={'#config': 'config'},
+            ExpressionAttributeValues={
+                ':config': _to_ddb(project_config.model_dump()),
+                ':now': now
+            },
+            ReturnValues='UPDATED_OLD'
         )
-        
+        is_update = bool(response.get('Attributes'))
+
         # Auto-load the project after saving
         st.session_state['loaded_selected_blds'] = selected_building_types.copy()
         st.session_state['loaded_current_bld'] = current_building_type
@@ -168,7 +231,10 @@ def save_project(project_name, range_results, selected_building_types, current_b
         
         # Flag for widget reset on next run
         st.session_state['need_widget_reset'] = True
-        
+
+        # The cached sidebar list is now stale
+        _project_list.clear()
+
         action = "updated" if is_update else "saved"
         return True, f"Project {action}!"
     except ClientError as e:
@@ -176,11 +242,11 @@ def save_project(project_name, range_results, selected_building_types, current_b
 
 def load_project_config(project_name):
     """Load and restore a project configuration"""
-    if 'access_token' not in st.session_state:
+    if not st.session_state.get('access_token'):
         return False, "Please log in to load projects"
     
     try:
-        response = table.get_item(
+        response = _aws().table.get_item(
             Key={
                 'username': st.session_state['username'],
                 'project_name': project_name
@@ -188,8 +254,13 @@ def load_project_config(project_name):
         )
         
         if 'Item' in response:
-            config_data = json.loads(response['Item']['config'])
-            project_config = ProjectConfig(**config_data)
+            raw_config = response['Item']['config']
+            if isinstance(raw_config, str):
+                # Legacy JSON-string format: parse straight into the model
+                # with pydantic-core instead of json.loads + ProjectConfig(**...)
+                project_config = ProjectConfig.model_validate_json(raw_config)
+            else:
+                project_config = ProjectConfig.model_validate(_from_ddb(raw_config))
             
             # Restore session state (but NOT widget states - that causes Streamlit errors)
             st.session_state['loaded_selected_blds'] = project_config.selected_building_types
@@ -210,44 +281,159 @@ def load_project_config(project_name):
 
 def delete_project(project_name):
     """Delete a project"""
-    if 'access_token' not in st.session_state:
+    if not st.session_state.get('access_token'):
         return False, "Please log in to delete projects"
     
     try:
-        # Debug: Show what we're trying to delete
         username = st.session_state['username']
-        print(f"Attempting to delete project: {project_name} for user: {username}")
-        
-        response = table.delete_item(
+        log.debug("Deleting project %s for user %s", project_name, username)
+
+        _aws().table.delete_item(
             Key={
                 'username': username,
                 'project_name': project_name
             }
         )
-        
-        # Debug: Show response
-        print(f"Delete response: {response}")
+        # The cached sidebar list is now stale
+        _project_list.clear()
         return True, f"Project '{project_name}' deleted successfully!"
     except ClientError as e:
-        print(f"Delete error: {str(e)}")
+        log.exception("Delete failed for project %s", project_name)
         return False, str(e)
     except Exception as e:
-        print(f"Unexpected delete error: {str(e)}")
+        log.exception("Unexpected delete error for project %s", project_name)
         return False, f"Unexpected error: {str(e)}"
 
+# The helpers below take username explicitly (instead of reading
+# st.session_state) so callers outside the script thread stay possible.
+def _query_projects(username):
+    """Paginated query projecting only what the sidebar list renders.
+
+    The full config map is fetched lazily by load_project_config when the
+    user actually opens a project.
+    """
+    kwargs: dict[str, Any] = dict(
+        KeyConditionExpression=Key('username').eq(username),
+        ProjectionExpression=(
+            '#p, created_at, updated_at, #r, #c.current_building_type, '
+            '#c.square_footage, #c.range_results.#a.tonnage'
+        ),
+        ExpressionAttributeNames={
+            '#p': 'project_name',
+            '#c': 'config',
+            '#r': 'results',
+            # 'avg' is a DynamoDB reserved word, and reserved-word checks
+            # apply to every document-path segment
+            '#a': 'avg',
+        },
+    )
+    response = _aws().table.query(**kwargs)
+    items = response['Items']
+    # With the projection keeping items small, a user's list essentially
+    # never spans multiple 1 MB pages; plain sequential pagination is the
+    # simple, thread-safe way to cover the rare case where it does
+    while 'LastEvaluatedKey' in response:
+        response = _aws().table.query(
+            ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs
+        )
+        items.extend(response['Items'])
+
+    # Projects saved before config became a native map store it as a JSON
+    # string, so the #c.* document paths project to nothing and the item
+    # comes back with neither 'config' nor 'results'. Fetch those few
+    # items whole so they still render in the list.
+    legacy_names = [
+        item['project_name']
+        for item in items
+        if 'config' not in item and 'results' not in item
+    ]
+    if legacy_names:
+        full_items = {
+            item['project_name']: item
+            for item in _batch_get(username, legacy_names)
+        }
+        items = [full_items.get(item['project_name'], item) for item in items]
+    return items
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _project_list(username):
+    """Short-lived cache so rapid reruns don't re-query the project list"""
+    return _query_projects(username)
+
+# BatchGetItem takes at most 100 keys per request
+_BATCH_GET_MAX_KEYS = 100
+_BATCH_GET_MAX_RETRIES = 5
+
+def _batch_get(username, project_names):
+    """BatchGetItem in 100-key chunks with bounded backoff on UnprocessedKeys"""
+    items = []
+    for start in range(0, len(project_names), _BATCH_GET_MAX_KEYS):
+        request_items = {
+            DYNAMODB_TABLE_NAME: {
+                'Keys': [
+                    {'username': username, 'project_name': name}
+                    for name in project_names[start:start + _BATCH_GET_MAX_KEYS]
+                ]
+            }
+        }
+        delay = 0.1
+        retries = 0
+        while request_items:
+            response = _aws().dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(DYNAMODB_TABLE_NAME, []))
+            # Retry throttled keys with exponential backoff, but never hang
+            # the rerun on persistent throttling: return what we have
+            request_items = response.get('UnprocessedKeys') or {}
+            if request_items:
+                if retries >= _BATCH_GET_MAX_RETRIES:
+                    log.warning(
+                        "batch_get_item still throttled after %d retries; "
+                        "returning partial results", retries
+                    )
+                    break
+                time.sleep(delay)
+                delay *= 2
+                retries += 1
+    return items
+
 def load_projects():
-    if 'access_token' not in st.session_state:
+    """Load the user's project list from the short-lived cache"""
+    if not st.session_state.get('access_token'):
         return None
 
     try:
-        response = table.query(
-            KeyConditionExpression=Key('username').eq(st.session_state['username'])
-        )
-        return response['Items']
+        return _project_list(st.session_state['username'])
     except ClientError as e:
         st.error(str(e))
         return None
 
+def _project_summary(project):
+    """Build the (preview, detail, is_legacy) strings for one sidebar entry"""
+    created_date = (project.get('created_at') or 'Unknown date')[:10]
+    try:
+        # Check if this is new format (has 'config') or old format (has 'results')
+        if 'config' in project:
+            # New format with full config
+            config_data = _parse_config(project['config'])
+            building_type = config_data.get('current_building_type', 'Unknown')
+            sq_ft = config_data.get('square_footage', 0)
+            avg_tonnage = config_data['range_results']['avg']['tonnage']
+            return f"📅 {created_date}", f"{building_type} • {sq_ft:,} sq ft • {avg_tonnage:.1f} tons", False
+        elif 'results' in project:
+            # Old format - extract from results
+            results_data = _json_loads(project['results'])
+            tonnage = results_data.get('tonnage', 0)
+            occupancy = results_data.get('total_occupancy', 0)
+            electrical = results_data.get('electrical_kw', 0)
+            return (
+                f"📅 {created_date} • Legacy Format",
+                f"{tonnage:.1f} tons • {occupancy:.0f} people • {electrical:.1f} kW",
+                True,
+            )
+        return "Invalid project data", "", False
+    except (ValueError, KeyError, TypeError):
+        return f"📅 {created_date} • Error loading project", "Unable to parse project data", False
+
 # Beautification: Custom theme and page config
 st.set_page_config(
     page_title="Cooling Load Estimator",
@@ -256,8 +442,10 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Add custom HTML meta tags for social media sharing with logo
-st.html("""
+# Static page chrome: social-media meta tags and mobile CSS. Kept as module
+# constants and returned through a cached helper so reruns skip rebuilding
+# the ~3 KB strings.
+META_HTML: str = """
 <link rel="icon" type="image/png" href="assets/Cooling Load Estimator Logo.png">
 <link rel="apple-touch-icon" href="assets/Cooling Load Estimator Logo.png">
 <meta property="og:title" content="Cooling Load Estimator" />
@@ -276,128 +464,38 @@ st.html("""
 <meta name="twitter:image:alt" content="Cooling Load Estimator - Professional HVAC Calculator" />
 <meta name="description" content="Professional HVAC cooling load calculator based on category and square footage. Calculate tonnage, occupancy, and electrical loads for various building types." />
 <meta name="author" content="Load Estimator" />
-""")
-
-# Add mobile-responsive CSS
-st.markdown("""
-<style>
-    /* Mobile-responsive improvements */
-    @media (max-width: 768px) {
-        /* Improve sidebar width on mobile */
-        section[data-testid="stSidebar"] {
-            width: 85% !important;
-            max-width: 350px !important;
-        }
-        
-        /* Larger touch targets for mobile */
-        button[kind="primary"], button[kind="secondary"] {
-            min-height: 48px !important;
-            font-size: 16px !important;
-            padding: 12px 24px !important;
-        }
-        
-        /* Better form input styling for mobile */
-        input[type="text"], input[type="password"], input[type="email"] {
-            font-size: 16px !important;
-            padding: 12px !important;
-            min-height: 48px !important;
-            -webkit-appearance: none;
-            -moz-appearance: none;
-            appearance: none;
-        }
-        
-        /* Improve tab navigation on mobile */
-        div[data-testid="stTabs"] button {
-            font-size: 16px !important;
-            padding: 10px 16px !important;
-            min-height: 44px !important;
-        }
-        
-        /* Better spacing for mobile forms */
-        div[data-testid="stForm"] {
-            padding: 16px !important;
-        }
-        
-        /* Ensure form submit buttons are full width on mobile */
-        div[data-testid="stForm"] button[type="submit"] {
-            width: 100% !important;
-            min-height: 48px !important;
-            font-size: 16px !important;
-            margin-top: 8px !important;
-        }
-        
-        /* Improve metric display on mobile */
-        div[data-testid="metric-container"] {
-            padding: 12px !important;
-        }
-        
-        /* Better button spacing */
-        div.stButton > button {
-            margin-bottom: 8px !important;
-        }
-    }
-    
-    /* General improvements for all devices */
-    /* Ensure inputs don't zoom on focus (iOS) */
-    input[type="text"], input[type="password"], input[type="email"] {
-        font-size: 16px !important;
-    }
-    
-    /* Improve form labels */
-    label {
-        font-size: 14px !important;
-        font-weight: 500 !important;
-        margin-bottom: 4px !important;
-    }
-    
-    /* Better error/success message styling */
-    div.stAlert {
-        padding: 12px 16px !important;
-        font-size: 14px !important;
-    }
-    
-    /* Additional mobile improvements */
-    @media (max-width: 768px) {
-        /* Make columns stack on mobile for auth buttons */
-        div[data-testid="column"] {
-            width: 100% !important;
-            flex: 100% !important;
-        }
-        
-        /* Add spacing between stacked buttons */
-        div[data-testid="column"]:not(:last-child) {
-            margin-bottom: 8px !important;
-        }
-        
-        /* Ensure forms are scrollable on small screens */
-        section[data-testid="stSidebar"] > div {
-            overflow-y: auto !important;
-            -webkit-overflow-scrolling: touch !important;
-        }
-    }
-    
-    /* Prevent text selection on buttons */
-    button {
-        -webkit-user-select: none;
-        -moz-user-select: none;
-        -ms-user-select: none;
-        user-select: none;
-        -webkit-tap-highlight-color: transparent;
-    }
-    
-    /* Improve focus states */
-    input:focus, button:focus {
-        outline: 2px solid #4da6ff !important;
-        outline-offset: 2px !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+# The mobile-responsive CSS lives in static/app.css and is served by
+# Streamlit's static file handler, so the browser caches it instead of
+# receiving ~3 KB of markup over the WebSocket on every rerun. The mtime
+# query string busts the cache when the file changes.
+
+
+@st.cache_data(show_spinner=False)
+def _page_chrome() -> tuple[str, str]:
+    """Static meta tags and stylesheet link, materialized once per process"""
+    try:
+        css_version = int(os.path.getmtime('static/app.css'))
+    except OSError:
+        css_version = 0
+    css_link = f'<link rel="stylesheet" href="app/static/app.css?v={css_version}">'
+    return META_HTML, css_link
+
+
+_meta_html, _css_link = _page_chrome()
+st.html(_meta_html)
+st.markdown(_css_link, unsafe_allow_html=True)
 
 # Removed dark mode toggle and custom CSS; using official theme from config.toml
 
 
 class BuildingData(BaseModel):
     """Building data model"""
+    # frozen makes instances hashable (and skips the __setattr__ guard);
+    # extra='ignore' drops stray uploaded-CSV columns without a collect pass
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra='ignore')
+
     building_type: str = Field(alias="Building Type")
 
     refrig_low:   Optional[float] = Field(alias="Refrigeration_Low")
@@ -420,16 +518,6 @@ class BuildingData(BaseModel):
     internalcfm_avg:   Optional[float] = Field(alias="InternalCFM_Avg")
     internalcfm_high:  Optional[float] = Field(alias="InternalCFM_High")
 
-    @model_validator(mode='before')
-    @classmethod
-    def convert_empty_to_none(cls, values: dict[str, Any]) -> dict[str, Any]:  # type: ignore
-        """Convert empty strings and NaNs to None"""
-
-        for k, v in values.items():
-            if v == "" or pd.isna(v):
-                values[k] = None
-        return values
-
     @model_validator(mode='after')
     def require_building_and_one_rate(self) -> 'BuildingData':  # type: ignore
         """Require building type and at least one rate"""
@@ -474,43 +562,145 @@ class ProjectConfig(BaseModel):
     updated_at: str
 
 
+# Column alias -> field name map, built once for vectorized record construction
+ALIAS_MAP: dict[str, str] = {
+    field.alias: name
+    for name, field in BuildingData.model_fields.items()
+    if field.alias
+}
+NUMERIC_DTYPES: dict[str, type] = {
+    alias: float for alias in ALIAS_MAP if alias != "Building Type"
+}
+
+
+def _records_from_frame(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a raw CSV frame into field-name records with NaN mapped to None"""
+    # The object cast matters: on float columns, where() keeps NaN instead
+    # of inserting None, which would silently change the missing-rate
+    # sentinel the models expect
+    df = df.astype(object).where(df.notna(), None)  # type: ignore
+    return df.rename(columns=ALIAS_MAP).to_dict(orient='records')  # type: ignore
+
+
+# Built once; TypeAdapter construction compiles a validator schema
+_BUILDING_LIST_ADAPTER = TypeAdapter(List[BuildingData])
+
+
+RateTuple = tuple[Optional[float], Optional[float], Optional[float]]
+
+
+def _build_rates(validated: List[BuildingData]) -> dict[str, dict[str, RateTuple]]:
+    """Index (refrig, occupancy, electrical) rate tuples per building and level"""
+    return {
+        bd.building_type: {
+            lvl: (
+                getattr(bd, f'refrig_{lvl}'),
+                getattr(bd, f'occupancy_{lvl}'),
+                getattr(bd, f'electrical_{lvl}'),
+            )
+            for lvl in ('low', 'avg', 'high')
+        }
+        for bd in validated
+    }
+
+
+def _build_rate_arrays(
+    rates: dict[str, dict[str, RateTuple]]
+) -> tuple[np.ndarray, dict[str, int]]:
+    """Stack every building's rates into one (n, 3, 3) float64 array.
+
+    Axis 1 is the load level (low/avg/high), axis 2 is (refrig, occupancy,
+    electrical); NaN marks missing rates. The name->row index supports fancy
+    indexing for multi-building comparisons without Python loops. float64
+    keeps the array values bit-identical to the CSV floats, which feed
+    user-visible tables, PDFs and saved projects.
+    """
+    names = list(rates)
+    if not names:
+        return np.empty((0, 3, 3), dtype=np.float64), {}
+    arr = np.array(
+        [[rates[n]['low'], rates[n]['avg'], rates[n]['high']] for n in names],
+        dtype=np.float64,
+    )
+    return arr, {n: i for i, n in enumerate(names)}
+
+
+@st.cache_resource
+def _load_validated(
+    path: str, mtime: float
+) -> tuple[
+    List[BuildingData],
+    List[str],
+    frozenset[str],
+    dict[str, dict[str, RateTuple]],
+]:
+    """Parse and validate the bundled CSV once per process.
+
+    The mtime argument keys the cache so an updated CSV is picked up on the
+    next rerun without restarting the server.
+    """
+    df_raw = pd.read_csv(path, dtype=NUMERIC_DTYPES, na_values=[''])  # type: ignore
+    # Rows without a Building Type are unusable; drop them up front
+    df_raw = df_raw[df_raw['Building Type'].notna()]
+    # Bundled CSV is trusted, so skip per-field validation
+    validated = [
+        BuildingData.model_construct(**r) for r in _records_from_frame(df_raw)
+    ]
+    names = [b.building_type for b in validated]
+    # names stays a list for ordered display; the frozenset serves O(1)
+    # membership checks
+    return validated, names, frozenset(names), _build_rates(validated)
+
+
 # Load and validate data
 data_path: str = 'ashrae_data.csv'
 validated_data: List[BuildingData] = []
+building_types: List[str] = []
+BUILDING_TYPES_SET: frozenset[str] = frozenset()
+RATES: dict[str, dict[str, RateTuple]] = {}
+ALL_RATES, BLD_TO_IDX = _build_rate_arrays({})
 if os.path.exists(data_path):
     try:
-        df_raw = pd.read_csv(data_path, dtype=str)  # type: ignore
-        for i, (_, row) in enumerate(df_raw.iterrows()):
-            try:
-                bd = BuildingData(**row.to_dict())  # type: ignore
-                validated_data.append(bd)
-            except ValidationError as e:
-                st.warning(f"Invalid data in CSV row {i + 2}: {e}")
+        validated_data, building_types, BUILDING_TYPES_SET, RATES = _load_validated(
+            data_path, os.path.getmtime(data_path)
+        )
+        ALL_RATES, BLD_TO_IDX = _build_rate_arrays(RATES)
     except Exception as e:
         st.error(f'Error loading CSV: {e}')
 else:
     st.error(f"CSV file '{data_path}' not found.")
 
-# Prepare lookups
-building_types = [b.building_type for b in validated_data]
-
-# Initialize session state
-if 'selected_bld' not in st.session_state:
-    st.session_state.selected_bld = None
-if 'project_loaded' not in st.session_state:
-    st.session_state['project_loaded'] = False
-if 'loaded_selected_blds' not in st.session_state:
-    st.session_state['loaded_selected_blds'] = []
-if 'loaded_current_bld' not in st.session_state:
-    st.session_state['loaded_current_bld'] = None
-if 'loaded_sq_ft' not in st.session_state:
-    st.session_state['loaded_sq_ft'] = 7500
-if 'loaded_project_name' not in st.session_state:
-    st.session_state['loaded_project_name'] = None
-if 'show_save_as_new' not in st.session_state:
-    st.session_state['show_save_as_new'] = False
-if 'show_save_as_main' not in st.session_state:
-    st.session_state['show_save_as_main'] = False
+# Multiselect default, resolved once per dataset instead of per rerun
+DEFAULT_BLDS: List[str] = (
+    ["Office Buildings (General)"]
+    if "Office Buildings (General)" in BUILDING_TYPES_SET
+    else building_types[:1]
+)
+
+# Initialize session state in one pass instead of per-key guards scattered
+# across the script
+_SESSION_DEFAULTS = (
+    ('selected_bld', None),
+    ('project_loaded', False),
+    ('loaded_selected_blds', []),
+    ('loaded_current_bld', None),
+    ('loaded_sq_ft', 7500),
+    ('loaded_project_name', None),
+    ('show_save_as_new', False),
+    ('show_save_as_main', False),
+    ('access_token', None),
+    ('username', None),
+    ('show_auth_form', False),
+    ('auth_source', None),
+)
+for _key, _default in _SESSION_DEFAULTS:
+    st.session_state.setdefault(_key, _default)
+
+# Button handlers that rerun stash their feedback here instead of
+# rendering a delta the rerun would immediately discard
+_flash = st.session_state.pop('_flash', None)
+if _flash:
+    st.toast(_flash[1])
 
 # Remove zone-related state
 
@@ -560,13 +750,18 @@ def has_project_state_changed():
 # Sidebar
 st.sidebar.title("Input Parameters")
 
+# Hoist hot session-state reads into locals once per rerun; SessionState
+# lookups get slower as the widget count grows
+ss = st.session_state
+project_loaded = ss.get('project_loaded')
+
 # Project Name field (only visible when authenticated)
-if st.session_state.get('access_token'):
-    if not st.session_state.get('project_loaded'):
-        project_name = st.sidebar.text_input("Project Name", placeholder="Enter project name...", key="sidebar_project_name")
-    else:
+if ss.get('access_token'):
+    # With no project loaded the name input renders inside the save form
+    # further down, so typing a name doesn't rerun the script
+    if project_loaded:
         # Show current project name (read-only when project is loaded)
-        st.sidebar.text_input("Project Name", value=st.session_state.get('loaded_project_name', ''), disabled=True, key="sidebar_loaded_project_name")
+        st.sidebar.text_input("Project Name", value=ss.get('loaded_project_name', ''), disabled=True, key="sidebar_loaded_project_name")
 else:
     # Show disabled field with login prompt for guests
     st.sidebar.text_input("Project Name", placeholder="Sign in to save projects", disabled=True, key="sidebar_guest_project_name")
@@ -574,34 +769,30 @@ else:
 st.sidebar.markdown("---")
 
 # Multi-select for building types - handle loaded project state properly
-if st.session_state.get('project_loaded') and st.session_state.get('need_widget_reset'):
-    # Clear existing widget states to allow reset
-    if 'selected_buildings' in st.session_state:
-        del st.session_state['selected_buildings']
-    if 'square_footage' in st.session_state:
-        del st.session_state['square_footage']
-    if 'current_building_selection' in st.session_state:
-        del st.session_state['current_building_selection']
-    
-    # Set widget states to match loaded project immediately after clearing
-    st.session_state['selected_buildings'] = st.session_state.get('loaded_selected_blds', [])
-    st.session_state['square_footage'] = st.session_state.get('loaded_sq_ft', 7500)
-    st.session_state['current_building_selection'] = st.session_state.get('loaded_current_bld')
-    
-    st.session_state['need_widget_reset'] = False
+if project_loaded and ss.get('need_widget_reset'):
+    # Clear existing widget states to allow reset, then set them to match
+    # the loaded project immediately after clearing
+    for _widget_key in ('selected_buildings', 'square_footage', 'current_building_selection'):
+        ss.pop(_widget_key, None)
+
+    ss['selected_buildings'] = ss.get('loaded_selected_blds', [])
+    ss['square_footage'] = ss.get('loaded_sq_ft', 7500)
+    ss['current_building_selection'] = ss.get('loaded_current_bld')
+
+    ss['need_widget_reset'] = False
 
 # Initialize session state for widgets if not present (to avoid default parameter conflicts)
-if 'selected_buildings' not in st.session_state:
-    if st.session_state.get('project_loaded'):
-        st.session_state['selected_buildings'] = st.session_state.get('loaded_selected_blds', ["Office Buildings (General)"])
+if 'selected_buildings' not in ss:
+    if project_loaded:
+        ss['selected_buildings'] = ss.get('loaded_selected_blds', ["Office Buildings (General)"])
     else:
-        st.session_state['selected_buildings'] = ["Office Buildings (General)"] if "Office Buildings (General)" in building_types else ([building_types[0]] if building_types else [])
+        ss['selected_buildings'] = DEFAULT_BLDS.copy()
 
-if 'square_footage' not in st.session_state:
-    if st.session_state.get('project_loaded'):
-        st.session_state['square_footage'] = st.session_state.get('loaded_sq_ft', 7500)
+if 'square_footage' not in ss:
+    if project_loaded:
+        ss['square_footage'] = ss.get('loaded_sq_ft', 7500)
     else:
-        st.session_state['square_footage'] = 7500
+        ss['square_footage'] = 7500
 
 # Create widgets using session state only (no default parameters)
 selected_blds = st.sidebar.multiselect(
@@ -617,70 +808,141 @@ sq_ft: int = st.sidebar.number_input("Building Area (sq ft)", min_value=0, step=
 # CSV override
 uploaded = st.sidebar.file_uploader("Upload Custom CSV", type="csv")
 if uploaded:
-    df_override = pd.read_csv(uploaded, dtype=str)  # type: ignore
-    temp = []
-    for i, (_, row) in enumerate(df_override.iterrows()):
-        try:
-            temp.append(BuildingData(**row.to_dict()))  # type: ignore
-        except ValidationError as e:
-            st.warning(f"Invalid data in uploaded CSV row {i + 2}: {e}")
+    temp: List[BuildingData] = []
+    try:
+        df_override = pd.read_csv(uploaded, dtype=NUMERIC_DTYPES, na_values=[''])  # type: ignore
+        temp = _BUILDING_LIST_ADAPTER.validate_python(
+            _records_from_frame(df_override)
+        )
+    except ValidationError as e:
+        st.warning(f"Invalid data in uploaded CSV: {e}")
+    except Exception as e:
+        st.warning(f"Error reading uploaded CSV: {e}")
     if temp:
         validated_data = temp
         building_types = [b.building_type for b in validated_data]
+        BUILDING_TYPES_SET = frozenset(building_types)
+        RATES = _build_rates(validated_data)
+        ALL_RATES, BLD_TO_IDX = _build_rate_arrays(RATES)
+        DEFAULT_BLDS = (
+            ["Office Buildings (General)"]
+            if "Office Buildings (General)" in BUILDING_TYPES_SET
+            else building_types[:1]
+        )
         st.sidebar.success("Custom data loaded!")
 
 # Computation
 @st.cache_data
-@validate_call
-def compute_results(
-    building_type: str,
-    area: float,
-    level: str,
-) -> Optional[Results]:
-    """Compute results for a given building type, area, and load level"""
-    if level not in ['Low', 'Avg', 'High']:
-        raise ValueError("Invalid load level")
-    bd = next((b for b in validated_data if b.building_type==building_type), None)
-    if bd is None:
-        return None
-    level_lower = level.lower()
-    r = getattr(bd, f"refrig_{level_lower}")
-    o = getattr(bd, f"occupancy_{level_lower}")
-    e = getattr(bd, f"electrical_{level_lower}")
-    if None in (r,o,e):
-        raise ValueError("Selected building type/load has missing data")
-    tonnage = float(area) / r
-    tot_occ = float(area) / o
-    elec_kw = (float(area) * e)/1000.0
-    return Results(
-        tonnage=tonnage,
-        total_occupancy=tot_occ,
-        electrical_kw=elec_kw,
-        design_params=DesignParams(refrig=r, occupancy=o, electrical=e),
-    )
-
-@st.cache_data
-@validate_call
 def compute_range_results(
     building_type: str,
     area: float,
 ) -> Optional[RangeResults]:
-    """Compute results for all three load levels (Low, Avg, High)"""
-    try:
-        low_result = compute_results(building_type, area, "Low")
-        avg_result = compute_results(building_type, area, "Avg")
-        high_result = compute_results(building_type, area, "High")
-        
-        if None in (low_result, avg_result, high_result):
-            return None
-            
-        return RangeResults(
-            low=low_result,
-            avg=avg_result,
-            high=high_result
-        )
-    except Exception:
+    """Compute results for all three load levels (Low, Avg, High) in one pass"""
+    idx = BLD_TO_IDX.get(building_type)
+    if idx is None:
+        return None
+    arr = ALL_RATES[idx]
+    if np.isnan(arr).any():
         return None
+    area = float(area)
+    tonnage = area / arr[:, 0]
+    occupancy = area / arr[:, 1]
+    electrical_kw = area * arr[:, 2] / 1000.0
+    # Internally generated values are floats by construction, so skip
+    # field validation. Design params come from the exact Python floats in
+    # RATES (not the array) so persisted and printed rates match the CSV.
+    exact = RATES[building_type]
+    results = {
+        lvl: Results.model_construct(
+            tonnage=float(tonnage[i]),
+            total_occupancy=float(occupancy[i]),
+            electrical_kw=float(electrical_kw[i]),
+            design_params=DesignParams.model_construct(
+                refrig=exact[lvl][0],
+                occupancy=exact[lvl][1],
+                electrical=exact[lvl][2],
+            ),
+        )
+        for i, lvl in enumerate(('low', 'avg', 'high'))
+    }
+    return RangeResults.model_construct(**results)
+
+
+@st.cache_data(show_spinner=False)
+def _result_tables(rr_json: str) -> tuple[dict[str, list[Any]], dict[str, list[Any]]]:
+    """Breakdown and design-rate table payloads for one results set.
+
+    Plain dicts-of-lists are enough for st.dataframe; a 12-cell DataFrame
+    isn't worth pandas block consolidation on every rerun. Values stay
+    numeric so Arrow ships floats, with display formatting left to
+    column_config at the render site.
+    """
+    rr = RangeResults.model_validate_json(rr_json)
+    levels = (rr.low, rr.avg, rr.high)
+    breakdown = {
+        'Load Level': ['Low', 'Average', 'High'],
+        'Tonnage': [r.tonnage for r in levels],
+        'Occupancy': [r.total_occupancy for r in levels],
+        'Electrical (kW)': [r.electrical_kw for r in levels],
+    }
+    rates = {
+        'Load Level': ['Low', 'Average', 'High'],
+        'Refrigeration Rate (ft²/ton)': [r.design_params.refrig for r in levels],
+        'Occupancy Rate (ft²/person)': [r.design_params.occupancy for r in levels],
+        'Plug/Light Rate (W/ft²)': [r.design_params.electrical for r in levels],
+    }
+    return breakdown, rates
+
+
+@st.cache_data(show_spinner=False)
+def _pdf_bytes(building_type: str, sq_ft: float, rr_json: str) -> bytes:
+    """Render the report PDF once per unique (building, area, results) set.
+
+    Takes the results as JSON so the cache key is cheaply hashable.
+    """
+    # Deferred: fpdf is only needed on a cache miss for the export button
+    from fpdf import FPDF  # type: ignore
+    from fpdf.enums import XPos, YPos  # type: ignore
+
+    range_results = RangeResults.model_validate_json(rr_json)
+    params = range_results.avg.design_params
+    # (header, body-lines) blocks; each body renders as one multi_cell so
+    # FPDF does a single layout pass per block instead of one per line
+    blocks = [
+        (None, [
+            f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
+            f'Building: {building_type}, Area: {sq_ft} sq ft',
+        ]),
+        ('Results Summary (Average Values):', [
+            f'Cooling Tonnage: {range_results.avg.tonnage:.2f} tons',
+            f'Total Occupancy: {range_results.avg.total_occupancy:.0f} people',
+            f'Plug/Light Load: {range_results.avg.electrical_kw:.2f} kW',
+        ]),
+        ('Load Range Analysis:', [
+            f'Tonnage Range: {range_results.low.tonnage:.2f} - {range_results.high.tonnage:.2f} tons',
+            f'Occupancy Range: {range_results.low.total_occupancy:.0f} - {range_results.high.total_occupancy:.0f} people',
+            f'Electrical Range: {range_results.low.electrical_kw:.2f} - {range_results.high.electrical_kw:.2f} kW',
+        ]),
+        ('Design Parameters (Average):', [
+            f'Refrigeration Rate: {params.refrig} ft²/ton',
+            f'Occupancy Rate: {params.occupancy} ft²/person',
+            f'Plug/Light Rate: {params.electrical} W/ft²',
+            'Note: Electrical values are estimated plug load and other equipment for HVAC heat gain assumptions.',
+        ]),
+    ]
+    pdf = FPDF()  # type: ignore
+    pdf.add_page()
+    pdf.set_font('helvetica', 'B', 12)
+    pdf.cell(0, 10, 'Cooling Load Estimator Report', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    for header, lines in blocks:
+        if header:
+            pdf.ln(10)
+            pdf.set_font('helvetica', 'B', 11)
+            pdf.cell(0, 10, header, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.set_font('helvetica', '', 10)
+        pdf.multi_cell(0, 10, '\n'.join(lines))
+    # fpdf2 returns a bytearray; no latin-1 encode pass needed
+    return bytes(pdf.output())  # type: ignore
 
 
 # Determine chosen building for computation (the selectbox will appear later for better UX)
@@ -704,38 +966,51 @@ if chosen_bld:
     except Exception as err:
         st.error(f"Calculation error for {chosen_bld}: {err}")
 
+def _handle_save(project_name, range_results, flash_msg):
+    """Persist the current form state under `project_name`.
+
+    Shared by the Save / Update / Save-As-New buttons: gathers the widget
+    state with fallbacks, calls save_project and stashes flash feedback.
+    Returns True on success so the caller decides when to rerun.
+    """
+    current_buildings = st.session_state.get('selected_buildings', [])
+    current_building = st.session_state.get('current_building_selection')
+    current_sq_ft = st.session_state.get('square_footage', 7500)
+
+    # Fallback for building selection if None
+    if not current_building and current_buildings:
+        current_building = current_buildings[0]
+
+    success, message = save_project(
+        project_name,
+        range_results,
+        current_buildings,
+        current_building,
+        current_sq_ft
+    )
+    if success:
+        st.session_state['_flash'] = ('success', flash_msg)
+    else:
+        st.toast(message, icon="❌")
+    return success
+
+
 # Add save button in sidebar after computation (only show when no project is loaded AND user is logged in)
 with st.sidebar:
     if not st.session_state.get('project_loaded') and st.session_state.get('access_token'):
-        # Get project name from session state or default
-        current_project_name = st.session_state.get('sidebar_project_name', '')
-        if st.button("💾 Save Project", use_container_width=True, type="primary", key="sidebar_save_after_computation"):
+        # Form batches the name input + button into one delta; typing a
+        # name no longer reruns the whole script until submit
+        with st.form("save_new_project_form"):
+            current_project_name = st.text_input("Project Name", placeholder="Enter project name...", key="sidebar_project_name")
+            save_submitted = st.form_submit_button("💾 Save Project", use_container_width=True, type="primary")
+        if save_submitted:
             if current_project_name and range_results:
-                # Get current state with fallbacks
-                current_buildings = st.session_state.get('selected_buildings', [])
-                current_building = st.session_state.get('current_building_selection')
-                current_sq_ft = st.session_state.get('square_footage', 7500)
-                
-                # Fallback for building selection if None
-                if not current_building and current_buildings:
-                    current_building = current_buildings[0]
-                
-                success, message = save_project(
-                    current_project_name, 
-                    range_results, 
-                    current_buildings,
-                    current_building, 
-                    current_sq_ft
-                )
-                if success:
-                    st.success("✅ Saved!")
+                if _handle_save(current_project_name, range_results, "✅ Saved!"):
                     st.rerun()
-                else:
-                    st.error(f"❌ {message}")
             elif not current_project_name:
-                st.warning("⚠️ Enter project name")
+                st.toast("Enter project name", icon="⚠️")
             elif not range_results:
-                st.warning("⚠️ Complete calculation first")
+                st.toast("Complete calculation first", icon="⚠️")
     elif not st.session_state.get('project_loaded') and not st.session_state.get('access_token'):
         # Show login prompt instead of save button
         st.info("🔐 Sign in to save projects")
@@ -787,28 +1062,9 @@ if st.session_state.get('project_loaded') and st.session_state.get('loaded_proje
                     use_container_width=True, 
                     disabled=update_disabled):
             if range_results:
-                # Get current state with fallbacks
-                current_buildings = st.session_state.get('selected_buildings', [])
-                current_building = st.session_state.get('current_building_selection')
-                current_sq_ft = st.session_state.get('square_footage', 7500)
-                
-                # Fallback for building selection if None
-                if not current_building and current_buildings:
-                    current_building = current_buildings[0]
-                
-                success, message = save_project(
-                    st.session_state['loaded_project_name'], 
-                    range_results, 
-                    current_buildings,
-                    current_building, 
-                    current_sq_ft
-                )
-                if success:
-                    st.success("✅ Project updated!")
-                    # Auto-loading is now handled by save_project function
+                # Auto-loading is now handled by save_project function
+                if _handle_save(st.session_state['loaded_project_name'], range_results, "✅ Project updated!"):
                     st.rerun()
-                else:
-                    st.error(f"❌ {message}")
     
     with col2:
         # Save As New - always enabled
@@ -828,17 +1084,13 @@ if st.session_state.get('project_loaded') and st.session_state.get('loaded_proje
             # Force reload the project and reset widgets
             success, message = load_project_config(st.session_state['loaded_project_name'])
             if success:
-                st.success("✅ Changes reverted!")
+                st.session_state['_flash'] = ('success', "✅ Changes reverted!")
                 # Force widget reset by clearing widget states
-                if 'selected_buildings' in st.session_state:
-                    del st.session_state['selected_buildings']
-                if 'square_footage' in st.session_state:
-                    del st.session_state['square_footage']
-                if 'current_building_selection' in st.session_state:
-                    del st.session_state['current_building_selection']
+                for _widget_key in ('selected_buildings', 'square_footage', 'current_building_selection'):
+                    st.session_state.pop(_widget_key, None)
                 st.rerun()
             else:
-                st.error(f"❌ {message}")
+                st.toast(message, icon="❌")
     
     with col4:
         # Close Project - always enabled
@@ -846,10 +1098,8 @@ if st.session_state.get('project_loaded') and st.session_state.get('loaded_proje
             st.session_state['project_loaded'] = False
             st.session_state['loaded_project_name'] = None
             # Clear widget states properly
-            if 'selected_buildings' in st.session_state:
-                del st.session_state['selected_buildings']
-            if 'square_footage' in st.session_state:
-                del st.session_state['square_footage']
+            for _widget_key in ('selected_buildings', 'square_footage'):
+                st.session_state.pop(_widget_key, None)
             st.rerun()
 
 # Professional branded header with logo
@@ -865,42 +1115,27 @@ if st.session_state.get('show_save_as_main') and st.session_state.get('access_to
     st.markdown("---")
     st.markdown("### 💾 Save as New Project")
     
-    col1, col2, col3 = st.columns([3, 1, 1])
-    with col1:
-        new_project_name = st.text_input("Project Name", placeholder="Enter new project name...", key="main_new_project_name", label_visibility="collapsed")
-    with col2:
-        if st.button("💾 Save", type="primary", key="main_save_new", use_container_width=True):
-            if new_project_name and range_results:
-                # Get current state with fallbacks
-                current_buildings = st.session_state.get('selected_buildings', [])
-                current_building = st.session_state.get('current_building_selection')
-                current_sq_ft = st.session_state.get('square_footage', 7500)
-                
-                # Fallback for building selection if None
-                if not current_building and current_buildings:
-                    current_building = current_buildings[0]
-                
-                success, message = save_project(
-                    new_project_name, 
-                    range_results, 
-                    current_buildings,
-                    current_building, 
-                    current_sq_ft
-                )
-                if success:
-                    st.success("✅ Saved as new project!")
-                    st.session_state['show_save_as_main'] = False
-                    st.rerun()
-                else:
-                    st.error(f"❌ {message}")
-            elif not new_project_name:
-                st.warning("⚠️ Enter project name")
-            elif not range_results:
-                st.warning("⚠️ Complete calculation first")
-    with col3:
-        if st.button("❌ Cancel", key="main_cancel_save_as", use_container_width=True):
-            st.session_state['show_save_as_main'] = False
-            st.rerun()
+    # Single form delta for the dialog: typing the name doesn't rerun
+    with st.form("main_save_as_form"):
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            new_project_name = st.text_input("Project Name", placeholder="Enter new project name...", key="main_new_project_name", label_visibility="collapsed")
+        with col2:
+            save_as_submitted = st.form_submit_button("💾 Save", type="primary", use_container_width=True)
+        with col3:
+            save_as_cancelled = st.form_submit_button("❌ Cancel", use_container_width=True)
+    if save_as_submitted:
+        if new_project_name and range_results:
+            if _handle_save(new_project_name, range_results, "✅ Saved as new project!"):
+                st.session_state['show_save_as_main'] = False
+                st.rerun()
+        elif not new_project_name:
+            st.toast("Enter project name", icon="⚠️")
+        elif not range_results:
+            st.toast("Complete calculation first", icon="⚠️")
+    elif save_as_cancelled:
+        st.session_state['show_save_as_main'] = False
+        st.rerun()
     st.markdown("---")
 
 # Show guest info if not authenticated
@@ -977,125 +1212,265 @@ else:
     st.caption('Note: **Average values** are shown prominently with full range below. Electrical load represents lights and plug loads for HVAC heat gain, not total service size.')
     
     # Show detailed breakdown
+    breakdown_data, rates_data = _result_tables(range_results.model_dump_json())
     st.subheader("Load Level Breakdown")
-    breakdown_df = pd.DataFrame({
-        'Load Level': ['Low', 'Average', 'High'],
-        'Tonnage': [f"{low_tonnage:.2f}", f"{avg_tonnage:.2f}", f"{high_tonnage:.2f}"],
-        'Occupancy': [f"{low_occ:.0f}", f"{avg_occ:.0f}", f"{high_occ:.0f}"],
-        'Electrical (kW)': [f"{low_elec:.2f}", f"{avg_elec:.2f}", f"{high_elec:.2f}"]
-    })
-    st.dataframe(breakdown_df, hide_index=True)  # type: ignore
-    
+    st.dataframe(  # type: ignore
+        breakdown_data,
+        hide_index=True,
+        column_config={
+            'Tonnage': st.column_config.NumberColumn(format="%.2f"),
+            'Occupancy': st.column_config.NumberColumn(format="%.0f"),
+            'Electrical (kW)': st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
+
     st.subheader("Design Rates")
-    rates_df = pd.DataFrame({
-        'Load Level': ['Low', 'Average', 'High'],
-        'Refrigeration Rate (ft²/ton)': [range_results.low.design_params.refrig, range_results.avg.design_params.refrig, range_results.high.design_params.refrig],
-        'Occupancy Rate (ft²/person)': [range_results.low.design_params.occupancy, range_results.avg.design_params.occupancy, range_results.high.design_params.occupancy],  
-        'Plug/Light Rate (W/ft²)': [range_results.low.design_params.electrical, range_results.avg.design_params.electrical, range_results.high.design_params.electrical]
-    })
-    st.dataframe(rates_df, hide_index=True)  # type: ignore
+    st.dataframe(rates_data, hide_index=True)  # type: ignore
 
     # Preserve PDF export
     st.subheader("Export")
     if chosen_bld and range_results:
-        def create_pdf(range_results: RangeResults, building_type: str, sq_ft: float) -> FPDF:
-            pdf = FPDF()  # type: ignore
-            pdf.add_page()
-            pdf.set_font('Arial', 'B', 12)
-            pdf.cell(0, 10, 'Cooling Load Estimator Report', ln=1)
-            pdf.set_font('Arial', '', 10)
-            pdf.cell(0, 10, f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', ln=1)
-            pdf.cell(0, 10, f'Building: {building_type}, Area: {sq_ft} sq ft', ln=1)
-            pdf.ln(10)
-            pdf.set_font('Arial', 'B', 11)
-            pdf.cell(0, 10, 'Results Summary (Average Values):', ln=1)
-            pdf.set_font('Arial', '', 10)
-            pdf.cell(0, 10, f'Cooling Tonnage: {range_results.avg.tonnage:.2f} tons', ln=1)
-            pdf.cell(0, 10, f'Total Occupancy: {range_results.avg.total_occupancy:.0f} people', ln=1)
-            pdf.cell(0, 10, f'Plug/Light Load: {range_results.avg.electrical_kw:.2f} kW', ln=1)
-            pdf.ln(10)
-            pdf.set_font('Arial', 'B', 11)
-            pdf.cell(0, 10, 'Load Range Analysis:', ln=1)
-            pdf.set_font('Arial', '', 10)
-            pdf.cell(0, 10, f'Tonnage Range: {range_results.low.tonnage:.2f} - {range_results.high.tonnage:.2f} tons', ln=1)
-            pdf.cell(0, 10, f'Occupancy Range: {range_results.low.total_occupancy:.0f} - {range_results.high.total_occupancy:.0f} people', ln=1)
-            pdf.cell(0, 10, f'Electrical Range: {range_results.low.electrical_kw:.2f} - {range_results.high.electrical_kw:.2f} kW', ln=1)
-            pdf.ln(10)
-            pdf.set_font('Arial', 'B', 11)
-            pdf.cell(0, 10, 'Design Parameters (Average):', ln=1)
-            pdf.set_font('Arial', '', 10)
-            params = range_results.avg.design_params
-            pdf.cell(0, 10, f'Refrigeration Rate: {params.refrig} ft²/ton', ln=1)
-            pdf.cell(0, 10, f'Occupancy Rate: {params.occupancy} ft²/person', ln=1)
-            pdf.cell(0, 10, f'Plug/Light Rate: {params.electrical} W/ft²', ln=1)
-            pdf.cell(0, 10, 'Note: Electrical values are estimated plug load and other equipment for HVAC heat gain assumptions.', ln=1)
-            return pdf  # type: ignore
-
-        pdf = create_pdf(range_results, chosen_bld, sq_ft)  # type: ignore
-        pdf_str = pdf.output(dest="S")  # type: ignore
-        pdf_bytes = pdf_str.encode("latin-1") if isinstance(pdf_str, str) else pdf_str  # type: ignore
-        b64 = base64.b64encode(pdf_bytes).decode("utf-8")  # type: ignore
-        st.markdown(
-            f'<a href="data:application/pdf;base64,{b64}" download="report.pdf">Download PDF</a>',
-            unsafe_allow_html=True,
+        st.download_button(
+            "Download PDF",
+            data=_pdf_bytes(chosen_bld, sq_ft, range_results.model_dump_json()),
+            file_name="report.pdf",
+            mime="application/pdf",
         )
 
 # --- Multi-Type Comparison Visualization ---
+@st.cache_data
+def comparison_fig(selected: tuple[str, ...], area: float) -> Optional[dict[str, Any]]:
+    """Build the tonnage-comparison figure for the selected buildings.
+
+    Tonnage for all buildings and levels is computed as one NumPy divide on
+    the stacked refrigeration-rate column, and the figure is cached as a dict
+    (hashable/serializable) keyed on the selection and area.
+    """
+    # Deferred: plotly.express drags in a large module chain and is only
+    # needed on cache misses when several building types are selected
+    import plotly.express as px  # type: ignore
+
+    names = [b for b in selected if b in BLD_TO_IDX]
+    if not names:
+        return None
+    # (k, 3) refrigeration rates via fancy indexing; NaN renders no bar
+    idx = np.fromiter((BLD_TO_IDX[b] for b in names), dtype=np.intp)
+    tonnage = area / ALL_RATES[idx, :, 0]
+    df_comp = pd.DataFrame({
+        "Building Type": np.repeat(names, 3),
+        "Load Level": np.tile(["Low", "Avg", "High"], len(names)),
+        "Tonnage": tonnage.ravel(),
+    })
+    fig = px.bar(  # type: ignore
+        df_comp,
+        x="Building Type",
+        y="Tonnage",
+        color="Load Level",
+        barmode="group",
+        title=f"Tonnage Ranges for {area:g} sq ft",
+        color_discrete_map={"Low": "#1f77b4", "Avg": "#ff7f0e", "High": "#2ca02c"}
+    )
+    fig.update_layout(  # type: ignore
+        plot_bgcolor="#1a1a1a",
+        paper_bgcolor="#1a1a1a",
+        font_color="#d9d9d9",
+        xaxis_title="Building Type",
+        yaxis_title="Tonnage (tons)",
+        legend_title="Load Level"
+    )
+    return fig.to_dict()  # type: ignore
+
+
 st.subheader("Tonnage Comparison Across Building Types")
 if len(selected_blds) > 1:
-    comparison_data: list[dict[str, str | float]] = []
-    for bld in selected_blds:
-        for level in ["Low", "Avg", "High"]:
-            try:
-                res = compute_results(bld, sq_ft, level)
-                if res:
-                    comparison_data.append({  # type: ignore
-                        "Building Type": bld,
-                        "Load Level": level,
-                        "Tonnage": res.tonnage
-                    })  # type: ignore
-            except Exception:
-                pass
-
-    if comparison_data:
-        df_comp = pd.DataFrame(comparison_data)
-        fig = px.bar(  # type: ignore
-            df_comp,
-            x="Building Type",
-            y="Tonnage",
-            color="Load Level",
-            barmode="group",
-            title=f"Tonnage Ranges for {sq_ft} sq ft",
-            color_discrete_map={"Low": "#1f77b4", "Avg": "#ff7f0e", "High": "#2ca02c"}
-        )
-        fig.update_layout(  # type: ignore
-            plot_bgcolor="#1a1a1a",
-            paper_bgcolor="#1a1a1a",
-            font_color="#d9d9d9",
-            xaxis_title="Building Type",
-            yaxis_title="Tonnage (tons)",
-            legend_title="Load Level"
-        )
-        st.plotly_chart(fig, use_container_width=True)  # type: ignore
+    # Deferred like plotly.express: graph_objects is the bulk of plotly's
+    # import cost and only this branch rehydrates the cached figure dict
+    import plotly.graph_objects as go  # type: ignore
+
+    fig_dict = comparison_fig(tuple(selected_blds), float(sq_ft))
+    if fig_dict:
+        st.plotly_chart(go.Figure(fig_dict), use_container_width=True)  # type: ignore
     else:
         st.warning("No valid data for comparison across selected types.")
 else:
     st.info("Select multiple building types to compare tonnage ranges.")
 
+@st.fragment
+def _projects_panel() -> None:
+    """Saved-projects list, scoped to its own fragment.
+
+    Selecting a row or toggling delete confirmation reruns only this panel;
+    loading or deleting a project still reruns the whole app so the
+    calculator picks up the change.
+    """
+    st.title("📁 Your Projects")
+    
+    # Load and display user projects
+    projects = load_projects()
+    if projects:
+        # Session-scoped memo of parsed previews, keyed by
+        # (project_name, updated_at) so unchanged projects are never
+        # re-parsed across reruns
+        _parsed = st.session_state.setdefault('_parsed_projects', {})
+        current_keys = {(p['project_name'], p.get('updated_at')) for p in projects}
+        for stale_key in [k for k in _parsed if k not in current_keys]:
+            del _parsed[stale_key]
+
+        # Paginate so the rendered table stays bounded no matter how many
+        # projects a user accumulates
+        PAGE_SIZE = 10
+        total = len(projects)
+        max_page = (total - 1) // PAGE_SIZE
+        page = min(st.session_state.setdefault('_proj_page', 0), max_page)
+        page_projects = projects[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+
+        rows = []
+        for project in page_projects:
+            project_name = project['project_name']
+            summary_key = (project_name, project.get('updated_at'))
+            summary = _parsed.get(summary_key)
+            if summary is None:
+                summary = _project_summary(project)
+                _parsed[summary_key] = summary
+            preview_text, detail_text, is_legacy = summary
+            rows.append({
+                'Project': project_name,
+                'Saved': preview_text,
+                'Details': detail_text,
+            })
+
+        # One selectable table instead of ~6 widgets per project; the
+        # action buttons render only for the selected row
+        st.dataframe(
+            rows,
+            hide_index=True,
+            use_container_width=True,
+            selection_mode='single-row',
+            on_select='rerun',
+            key='projects_table',
+        )
+        if total > PAGE_SIZE:
+            nav1, nav2, nav3 = st.columns([1, 2, 1])
+            with nav1:
+                if st.button("◀", key="proj_page_prev", disabled=page == 0):
+                    st.session_state['_proj_page'] = page - 1
+                    st.rerun(scope="fragment")
+            with nav2:
+                st.caption(f"Page {page + 1} of {max_page + 1}")
+            with nav3:
+                if st.button("▶", key="proj_page_next", disabled=page >= max_page):
+                    st.session_state['_proj_page'] = page + 1
+                    st.rerun(scope="fragment")
+
+        # Selection state can outlive the rows it pointed at (delete, list
+        # refresh, shorter last page), so bounds-check before indexing
+        selected_rows = st.session_state['projects_table']['selection']['rows']
+        if selected_rows and selected_rows[0] < len(page_projects):
+            project = page_projects[selected_rows[0]]
+            project_name = project['project_name']
+            _, _, is_legacy = _parsed[(project_name, project.get('updated_at'))]
+
+            # Action buttons - Load and Delete only (removed View)
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                # Disable load for legacy projects since they don't have full config
+                load_help = "⚠️ Cannot load legacy projects (missing configuration data)" if is_legacy else None
+                if st.button("📂 Load", key="project_load", use_container_width=True,
+                           type="primary", disabled=is_legacy, help=load_help):
+                    success, message = load_project_config(project_name)
+                    if success:
+                        st.session_state['_flash'] = ('success', message)
+                        st.rerun()
+                    else:
+                        st.toast(message, icon="❌")
+            with col2:
+                # A single session key tracks the one project (if
+                # any) awaiting delete confirmation
+                if st.session_state.get('_confirm_delete_project') == project_name:
+                    # Show confirmation buttons
+                    subcol1, subcol2 = st.columns([1, 1])
+                    with subcol1:
+                        if st.button("✅ Yes", key="project_delete_yes", use_container_width=True, type="primary"):
+                            success, message = delete_project(project_name)
+                            st.session_state['_confirm_delete_project'] = None
+                            if success:
+                                st.session_state['_flash'] = ('success', message)
+                                st.rerun()
+                            else:
+                                st.toast(message, icon="❌")
+                    with subcol2:
+                        if st.button("❌ No", key="project_delete_no", use_container_width=True):
+                            st.session_state['_confirm_delete_project'] = None
+                            st.rerun()
+                else:
+                    # Show delete button
+                    if st.button("🗑️ Delete", key="project_delete", use_container_width=True):
+                        st.session_state['_confirm_delete_project'] = project_name
+                        st.rerun()
+    else:
+        st.info("💡 No saved projects yet")
+
+
+@st.fragment
+def _auth_forms(prefix: str) -> None:
+    """Sign In / Sign Up / Confirm tabs, shared by sidebar and main area.
+
+    As a fragment, form submissions rerun only this block instead of the
+    whole script; sign-in still calls st.rerun() (app scope) to refresh
+    everything once authenticated.
+    """
+    auth_tab1, auth_tab2, auth_tab3 = st.tabs(["Sign In", "Sign Up", "Confirm"])
+
+    with auth_tab1:
+        with st.form(f"{prefix}_signin_form"):
+            username = st.text_input("Username", placeholder="Enter your username", key=f"{prefix}_username")
+            password = st.text_input("Password", type="password", placeholder="Enter your password", key=f"{prefix}_password")
+            signin_submitted = st.form_submit_button("Sign In", use_container_width=True, type="primary")
+
+            if signin_submitted and username and password:
+                success, message = sign_in(username, password)
+                if success:
+                    st.session_state['show_auth_form'] = False
+                    st.session_state['auth_source'] = None
+                    st.session_state['_flash'] = ('success', "✅ Signed in!")
+                    st.rerun()
+                else:
+                    st.error(f"❌ {message}")
+
+    with auth_tab2:
+        with st.form(f"{prefix}_signup_form"):
+            signup_username = st.text_input("Username", placeholder="Choose a username", key=f"{prefix}_signup_user")
+            signup_email = st.text_input("Email", placeholder="your@email.com", key=f"{prefix}_signup_email")
+            signup_password = st.text_input("Password", type="password", placeholder="Min 8 chars, 1 uppercase, 1 number", key=f"{prefix}_signup_pass")
+            st.caption("Password must be at least 8 characters with 1 uppercase letter and 1 number")
+            signup_submitted = st.form_submit_button("Sign Up", use_container_width=True, type="primary")
+
+            if signup_submitted and signup_username and signup_email and signup_password:
+                success, message = sign_up(signup_username, signup_password, signup_email)
+                if success:
+                    st.success("✅ Account created! Check your email for verification code.")
+                else:
+                    st.error(f"❌ {message}")
+
+    with auth_tab3:
+        with st.form(f"{prefix}_confirm_form"):
+            confirm_username = st.text_input("Username", placeholder="Your username", key=f"{prefix}_confirm_user")
+            confirm_code = st.text_input("Verification Code", placeholder="Check your email", key=f"{prefix}_confirm_code")
+            st.caption("Enter the 6-digit code from your email")
+            confirm_submitted = st.form_submit_button("Confirm Account", use_container_width=True, type="primary")
+
+            if confirm_submitted and confirm_username and confirm_code:
+                success, message = confirm_sign_up(confirm_username, confirm_code)
+                if success:
+                    st.success("✅ Account confirmed! You can now sign in.")
+                else:
+                    st.error(f"❌ {message}")
+
+
 # === SIDEBAR AUTHENTICATION & PROJECT MANAGEMENT ===
 with st.sidebar:
     st.title("🔐 Account")
-    
-    # Initialize session state for authentication
-    if 'access_token' not in st.session_state:
-        st.session_state['access_token'] = None
-    if 'username' not in st.session_state:
-        st.session_state['username'] = None
-    if 'show_auth_form' not in st.session_state:
-        st.session_state['show_auth_form'] = False
-    if 'auth_source' not in st.session_state:
-        st.session_state['auth_source'] = None
-    
+
     # User status and authentication
     if st.session_state.get('access_token'):
         # Logged in user UI
@@ -1118,102 +1493,7 @@ with st.sidebar:
         # Project controls moved to top of sidebar and main area for better UX
 
         st.divider()
-        st.title("📁 Your Projects")
-        
-        # Load and display user projects
-        projects = load_projects()
-        if projects:
-            for project in projects:
-                # Parse project config for preview
-                try:
-                    project_name = project['project_name']
-                    created_date = project.get('created_at', 'Unknown date')[:10] if project.get('created_at') else 'Unknown date'
-                    
-                    # Check if this is new format (has 'config') or old format (has 'results')
-                    if 'config' in project:
-                        # New format with full config
-                        config_data = json.loads(project['config'])
-                        building_type = config_data.get('current_building_type', 'Unknown')
-                        sq_ft = config_data.get('square_footage', 0)
-                        avg_tonnage = config_data['range_results']['avg']['tonnage']
-                        preview_text = f"📅 {created_date}"
-                        detail_text = f"{building_type} • {sq_ft:,} sq ft • {avg_tonnage:.1f} tons"
-                        is_legacy = False
-                    elif 'results' in project:
-                        # Old format - extract from results
-                        results_data = json.loads(project['results'])
-                        tonnage = results_data.get('tonnage', 0)
-                        occupancy = results_data.get('total_occupancy', 0)
-                        electrical = results_data.get('electrical_kw', 0)
-                        preview_text = f"📅 {created_date} • Legacy Format"
-                        detail_text = f"{tonnage:.1f} tons • {occupancy:.0f} people • {electrical:.1f} kW"
-                        is_legacy = True
-                    else:
-                        preview_text = "Invalid project data"
-                        detail_text = ""
-                        is_legacy = False
-                        
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
-                    created_date = project.get('created_at', 'Unknown date')[:10] if project.get('created_at') else 'Unknown date'
-                    preview_text = f"📅 {created_date} • Error loading project"
-                    detail_text = "Unable to parse project data"
-                    is_legacy = False
-                
-                # Project container
-                with st.container():
-                    st.markdown(f"**📊 {project_name}**")
-                    st.caption(preview_text)
-                    if detail_text:
-                        st.markdown(f"*{detail_text}*")
-                    
-                    # Action buttons - Load and Delete only (removed View)
-                    col1, col2 = st.columns([1, 1])
-                    with col1:
-                        # Disable load for legacy projects since they don't have full config
-                        load_disabled = is_legacy
-                        load_help = "⚠️ Cannot load legacy projects (missing configuration data)" if is_legacy else None
-                        
-                        if st.button("📂 Load", key=f"load_{project_name}", use_container_width=True, 
-                                   type="primary", disabled=load_disabled, help=load_help):
-                            success, message = load_project_config(project_name)
-                            if success:
-                                st.success(message)
-                                st.rerun()
-                            else:
-                                st.error(f"❌ {message}")
-                    with col2:
-                        # Check if this project is in confirmation state
-                        confirm_key = f'confirm_delete_{project_name}'
-                        if st.session_state.get(confirm_key, False):
-                            # Show confirmation buttons
-                            subcol1, subcol2 = st.columns([1, 1])
-                            with subcol1:
-                                if st.button("✅ Yes", key=f"confirm_yes_{project_name}", use_container_width=True, type="primary"):
-                                    success, message = delete_project(project_name)
-                                    st.session_state[confirm_key] = False  # Clear confirmation state
-                                    if success:
-                                        st.success(message)
-                                        st.rerun()
-                                    else:
-                                        st.error(f"❌ {message}")
-                            with subcol2:
-                                if st.button("❌ No", key=f"confirm_no_{project_name}", use_container_width=True):
-                                    st.session_state[confirm_key] = False
-                                    st.rerun()
-                        else:
-                            # Show delete button
-                            if st.button("🗑️ Delete", key=f"delete_{project_name}", use_container_width=True):
-                                # Clear any other confirmations and set this one
-                                for other_project in projects:
-                                    other_confirm_key = f'confirm_delete_{other_project["project_name"]}'
-                                    if other_confirm_key != confirm_key:
-                                        st.session_state[other_confirm_key] = False
-                                st.session_state[confirm_key] = True
-                                st.rerun()
-                    
-                    st.divider()
-        else:
-            st.info("💡 No saved projects yet")
+        _projects_panel()
     
     else:
         # Guest user UI
@@ -1224,55 +1504,12 @@ with st.sidebar:
             st.session_state['show_auth_form'] = not st.session_state.get('show_auth_form', False)
             st.session_state['auth_source'] = 'sidebar'
         
-        # Authentication form (collapsible)
-        if st.session_state.get('show_auth_form'):
+        # Authentication form (collapsible) - only built when the main-area
+        # copy isn't the one showing, so signed-out users pay for one set of
+        # auth forms per rerun instead of two
+        if st.session_state.get('show_auth_form') and st.session_state.get('auth_source') != 'main':
             st.divider()
-            auth_tab1, auth_tab2, auth_tab3 = st.tabs(["Sign In", "Sign Up", "Confirm"])
-            
-            with auth_tab1:
-                with st.form("signin_form"):
-                    username = st.text_input("Username", placeholder="Enter your username")
-                    password = st.text_input("Password", type="password", placeholder="Enter your password")
-                    signin_submitted = st.form_submit_button("Sign In", use_container_width=True, type="primary")
-                    
-                    if signin_submitted and username and password:
-                        success, message = sign_in(username, password)
-                        if success:
-                            st.session_state['show_auth_form'] = False
-                            st.session_state['auth_source'] = None
-                            st.success("✅ Signed in!")
-                            st.rerun()
-                        else:
-                            st.error(f"❌ {message}")
-            
-            with auth_tab2:
-                with st.form("signup_form"):
-                    signup_username = st.text_input("Username", placeholder="Choose a username", key="signup_user")
-                    signup_email = st.text_input("Email", placeholder="your@email.com", key="signup_email")
-                    signup_password = st.text_input("Password", type="password", placeholder="Min 8 chars, 1 uppercase, 1 number", key="signup_pass")
-                    st.caption("Password must be at least 8 characters with 1 uppercase letter and 1 number")
-                    signup_submitted = st.form_submit_button("Sign Up", use_container_width=True, type="primary")
-                    
-                    if signup_submitted and signup_username and signup_email and signup_password:
-                        success, message = sign_up(signup_username, signup_password, signup_email)
-                        if success:
-                            st.success("✅ Account created! Check your email for verification code.")
-                        else:
-                            st.error(f"❌ {message}")
-            
-            with auth_tab3:
-                with st.form("confirm_form"):
-                    confirm_username = st.text_input("Username", placeholder="Your username", key="confirm_user")
-                    confirm_code = st.text_input("Verification Code", placeholder="Check your email", key="confirm_code")
-                    st.caption("Enter the 6-digit code from your email")
-                    confirm_submitted = st.form_submit_button("Confirm Account", use_container_width=True, type="primary")
-                    
-                    if confirm_submitted and confirm_username and confirm_code:
-                        success, message = confirm_sign_up(confirm_username, confirm_code)
-                        if success:
-                            st.success("✅ Account confirmed! You can now sign in.")
-                        else:
-                            st.error(f"❌ {message}")
+            _auth_forms("sidebar")
 
 # === AUTHENTICATION FORM IN MAIN AREA (for mobile) ===
 if st.session_state.get('show_auth_form') and st.session_state.get('auth_source') == 'main':
@@ -1280,53 +1517,8 @@ if st.session_state.get('show_auth_form') and st.session_state.get('auth_source'
     st.subheader("🔐 Authentication")
     
     # Show the auth form here for convenience
-    auth_tab1, auth_tab2, auth_tab3 = st.tabs(["Sign In", "Sign Up", "Confirm"])
-    
-    with auth_tab1:
-        with st.form("main_signin_form"):
-            username = st.text_input("Username", placeholder="Enter your username", key="main_username")
-            password = st.text_input("Password", type="password", placeholder="Enter your password", key="main_password")
-            signin_submitted = st.form_submit_button("Sign In", use_container_width=True, type="primary")
-            
-            if signin_submitted and username and password:
-                success, message = sign_in(username, password)
-                if success:
-                    st.session_state['show_auth_form'] = False
-                    st.session_state['auth_source'] = None
-                    st.success("✅ Signed in!")
-                    st.rerun()
-                else:
-                    st.error(f"❌ {message}")
-    
-    with auth_tab2:
-        with st.form("main_signup_form"):
-            signup_username = st.text_input("Username", placeholder="Choose a username", key="main_signup_user")
-            signup_email = st.text_input("Email", placeholder="your@email.com", key="main_signup_email")
-            signup_password = st.text_input("Password", type="password", placeholder="Min 8 chars, 1 uppercase, 1 number", key="main_signup_pass")
-            st.caption("Password must be at least 8 characters with 1 uppercase letter and 1 number")
-            signup_submitted = st.form_submit_button("Sign Up", use_container_width=True, type="primary")
-            
-            if signup_submitted and signup_username and signup_email and signup_password:
-                success, message = sign_up(signup_username, signup_password, signup_email)
-                if success:
-                    st.success("✅ Account created! Check your email for verification code.")
-                else:
-                    st.error(f"❌ {message}")
-    
-    with auth_tab3:
-        with st.form("main_confirm_form"):
-            confirm_username = st.text_input("Username", placeholder="Your username", key="main_confirm_user")
-            confirm_code = st.text_input("Verification Code", placeholder="Check your email", key="main_confirm_code")
-            st.caption("Enter the 6-digit code from your email")
-            confirm_submitted = st.form_submit_button("Confirm Account", use_container_width=True, type="primary")
-            
-            if confirm_submitted and confirm_username and confirm_code:
-                success, message = confirm_sign_up(confirm_username, confirm_code)
-                if success:
-                    st.success("✅ Account confirmed! You can now sign in.")
-                else:
-                    st.error(f"❌ {message}")
-    
+    _auth_forms("main")
+
     if st.button("✖️ Cancel", use_container_width=True):
         st.session_state['show_auth_form'] = False
         st.session_state['auth_source'] = None
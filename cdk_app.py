@@ -156,13 +156,18 @@ class StreamlitStack(cdk.Stack):
         # Note: ApplicationLoadBalancedFargateService automatically creates both
         # root domain and www records when certificate includes subject_alternative_names
 
-        # Output the nameservers for GoDaddy configuration
-        cdk.CfnOutput(
-            self,
-            "NameServers",
-            value=cdk.Fn.join(", ", hosted_zone.hosted_zone_name_servers or []),
-            description="Add these nameservers to your GoDaddy domain settings",
-        )
+        # Output the nameservers for GoDaddy configuration. The name-server
+        # list is a deploy-time token, so the Fn::Join can't be resolved at
+        # synth; gate the output behind a context flag since it's only
+        # needed once, when delegating the domain at the registrar
+        # (synth with: cdk synth -c output_nameservers=1)
+        if self.node.try_get_context("output_nameservers"):
+            cdk.CfnOutput(
+                self,
+                "NameServers",
+                value=cdk.Fn.join(", ", hosted_zone.hosted_zone_name_servers or []),
+                description="Add these nameservers to your GoDaddy domain settings",
+            )
 
         # Output the certificate ARN for reference
         cdk.CfnOutput(